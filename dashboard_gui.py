@@ -1,10 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
 import threading
 from temperature_scraper import TemperatureScraper
-import pandas as pd
 from datetime import datetime
 
+TABLE_ROW_HEIGHT = 25
+
 class TemperatureDashboard:
     """GUI Dashboard for temperature data"""
 
@@ -14,9 +16,31 @@ class TemperatureDashboard:
         self.root.geometry("1000x700")
         self.root.configure(bg="#f0f0f0")
 
+        # Named fonts are resolved once and shared by every widget and style
+        self._font_body = tkfont.Font(family='Helvetica', size=10)
+        self._font_heading = tkfont.Font(family='Helvetica', size=10, weight='bold')
+        self._font_title = tkfont.Font(family='Helvetica', size=16, weight='bold')
+        self._font_mono = tkfont.Font(family='Courier', size=9)
+        self._font_mono_large = tkfont.Font(family='Courier', size=10)
+
         self.scraper = TemperatureScraper()
         self.data_df = None
 
+        # Table rows are kept off-widget; only the visible window is inserted
+        self._all_rows = []
+        self._shown_rows = {}
+        self._first_row = 0
+        # Index into _all_rows of the selected row, kept while it is scrolled out of view
+        self._selected_row = None
+
+        # Hash and max-temperature ordering of data_df, computed once per dataset
+        self._data_hash_value = None
+        self._sorted_idx = None
+
+        # Hashes of the data last rendered, so unchanged refreshes are skipped
+        self._table_hash = None
+        self._summary_hash = None
+
         self._create_widgets()
         self._apply_styles()
 
@@ -26,11 +50,11 @@ class TemperatureDashboard:
         style.theme_use('clam')
 
         # Configure colors
-        style.configure('TButton', font=('Helvetica', 10))
-        style.configure('TLabel', font=('Helvetica', 10), background="#f0f0f0")
-        style.configure('Title.TLabel', font=('Helvetica', 16, 'bold'), background="#f0f0f0")
-        style.configure('Treeview', font=('Courier', 9), rowheight=25)
-        style.configure('Treeview.Heading', font=('Helvetica', 10, 'bold'))
+        style.configure('TButton', font=self._font_body)
+        style.configure('TLabel', font=self._font_body, background="#f0f0f0")
+        style.configure('Title.TLabel', font=self._font_title, background="#f0f0f0")
+        style.configure('Treeview', font=self._font_mono, rowheight=TABLE_ROW_HEIGHT)
+        style.configure('Treeview.Heading', font=self._font_heading)
 
     def _create_widgets(self):
         """Create dashboard widgets"""
@@ -98,28 +122,136 @@ class TemperatureDashboard:
         for col in columns:
             self.tree.heading(col, text=col)
 
-        # Scrollbars
-        vsb = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        # Scrollbars (vertical scrolling is virtual, driven by _scroll_table)
+        self.vsb = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL, command=self._scroll_table)
         hsb = ttk.Scrollbar(self.table_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        self.tree.configure(xscroll=hsb.set)
+
+        self.tree.bind('<Configure>', lambda event: self._render_visible_rows())
+        self.tree.bind('<MouseWheel>', self._on_table_wheel)
+        self.tree.bind('<Button-4>', self._on_table_wheel)
+        self.tree.bind('<Button-5>', self._on_table_wheel)
+        self.tree.bind('<<TreeviewSelect>>', self._on_table_select)
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>'):
+            self.tree.bind(key, self._on_table_key)
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky='nsew')
-        vsb.grid(row=0, column=1, sticky='ns')
+        self.vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
 
         self.table_frame.grid_rowconfigure(0, weight=1)
         self.table_frame.grid_columnconfigure(0, weight=1)
 
+    def _visible_row_count(self):
+        """Number of rows that fit in the table viewport"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet, fall back to the configured height
+            return int(self.tree.cget('height'))
+
+        # Measure the heading and row size from the first row when one is shown,
+        # since the heading grows with its font
+        heading_height = row_height = TABLE_ROW_HEIGHT
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                heading_height, row_height = bbox[1], bbox[3]
+        return max(1, (height - heading_height) // row_height)
+
+    def _scroll_table(self, action, amount, unit=None):
+        """Handle scrollbar commands by moving the virtual row window"""
+        visible = self._visible_row_count()
+        if action == tk.MOVETO:
+            self._first_row = int(float(amount) * len(self._all_rows))
+        elif action == tk.SCROLL:
+            step = visible if unit == tk.PAGES else 1
+            self._first_row += int(amount) * step
+        self._render_visible_rows()
+
+    def _on_table_wheel(self, event):
+        """Scroll the virtual table with the mouse wheel"""
+        if event.num == 4 or event.delta > 0:
+            self._scroll_table(tk.SCROLL, -1, tk.UNITS)
+        else:
+            self._scroll_table(tk.SCROLL, 1, tk.UNITS)
+        return "break"
+
+    def _on_table_key(self, event):
+        """Move the selection with the keyboard, scrolling past the visible window"""
+        total = len(self._all_rows)
+        if not total:
+            return "break"
+
+        visible = self._visible_row_count()
+        steps = {'Up': -1, 'Down': 1, 'Prior': -visible, 'Next': visible}
+        if self._selected_row is None:
+            target = self._first_row
+        else:
+            target = max(0, min(self._selected_row + steps[event.keysym], total - 1))
+        self._selected_row = target
+
+        if target < self._first_row:
+            self._scroll_table(tk.SCROLL, target - self._first_row, tk.UNITS)
+        elif target >= self._first_row + visible:
+            self._scroll_table(tk.SCROLL, target - (self._first_row + visible - 1), tk.UNITS)
+        else:
+            self._render_visible_rows()
+        return "break"
+
+    def _on_table_select(self, event):
+        """Remember which data row is selected so it survives scrolling"""
+        selection = self.tree.selection()
+        # Empty selections come from rows being deleted as they scroll out of view
+        if not selection:
+            return
+        for idx, item in self._shown_rows.items():
+            if item == selection[0]:
+                self._selected_row = idx
+                break
+
+    def _render_visible_rows(self, remeasure=True):
+        """Insert only the rows in the visible window, updating just the delta"""
+        total = len(self._all_rows)
+        visible = self._visible_row_count()
+        self._first_row = max(0, min(self._first_row, total - visible))
+        window = range(self._first_row, min(self._first_row + visible, total))
+
+        # Remove rows that scrolled out of view in a single Tk call
+        stale = [self._shown_rows.pop(idx) for idx in list(self._shown_rows) if idx not in window]
+        if stale:
+            self.tree.delete(*stale)
+
+        for pos, idx in enumerate(window):
+            if idx not in self._shown_rows:
+                self._shown_rows[idx] = self.tree.insert('', pos, values=self._all_rows[idx])
+
+        # The first render has no row to measure the heading with, so check once more
+        if remeasure and self._shown_rows and self._visible_row_count() != visible:
+            self._render_visible_rows(remeasure=False)
+            return
+
+        # Restore the selection when its row is back in view
+        selected_item = self._shown_rows.get(self._selected_row)
+        if selected_item is not None and self.tree.selection() != (selected_item,):
+            self.tree.selection_set(selected_item)
+            self.tree.focus(selected_item)
+
+        if total:
+            self.vsb.set(window.start / total, window.stop / total)
+        else:
+            self.vsb.set(0.0, 1.0)
+
     def _create_summary_tab(self):
         """Create summary statistics tab"""
-        self.summary_text = scrolledtext.ScrolledText(self.summary_frame, wrap=tk.WORD, font=('Courier', 10))
+        self.summary_text = scrolledtext.ScrolledText(self.summary_frame, wrap=tk.WORD, font=self._font_mono_large)
         self.summary_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.summary_text.config(state=tk.DISABLED)
 
     def _create_log_tab(self):
         """Create logs tab"""
-        self.log_text = scrolledtext.ScrolledText(self.log_frame, wrap=tk.WORD, font=('Courier', 9))
+        self.log_text = scrolledtext.ScrolledText(self.log_frame, wrap=tk.WORD, font=self._font_mono)
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.log_text.config(state=tk.DISABLED)
 
@@ -130,25 +262,39 @@ class TemperatureDashboard:
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
+    def _ui(self, func, *args):
+        """Schedule a callable on the Tk main loop (Tkinter is not thread-safe)"""
+        self.root.after(0, func, *args)
+
     def _fetch_data_thread(self):
         """Fetch data in a separate thread to prevent UI freeze"""
         self.fetch_button.config(state=tk.DISABLED)
         self.status_label.config(text="Fetching data...")
-        self.root.update()
+        self.root.update_idletasks()
+        self._log_message("Starting data fetch...")
 
         thread = threading.Thread(target=self._fetch_data)
         thread.daemon = True
         thread.start()
 
     def _fetch_data(self):
-        """Fetch temperature data"""
+        """Fetch temperature data on the worker thread and hand it to the UI"""
         try:
-            self._log_message("Starting data fetch...")
-
-            # Scrape data
             self.scraper.scrape_weather_data()
-            self.data_df = pd.DataFrame(self.scraper.temperature_data)
+            data_df = self.scraper.to_dataframe()
+        except Exception as e:
+            self._ui(self._on_fetch_error, e)
+        else:
+            self._ui(self._on_fetch_done, data_df)
 
+    def _on_fetch_done(self, data_df):
+        """Render freshly fetched data (runs on the main loop)"""
+        try:
+            # The scraper skips failed cities, so being offline yields an empty frame
+            if data_df.empty:
+                raise ValueError("No city data could be fetched. Check your internet connection.")
+
+            self._set_data(data_df)
             self._log_message(f"Successfully fetched data for {len(self.data_df)} cities")
 
             # Update table
@@ -167,85 +313,134 @@ class TemperatureDashboard:
             self.refresh_label.config(text=f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
 
         except Exception as e:
-            self._log_message(f"Error: {str(e)}")
-            self.status_label.config(text=f"✗ Error: {str(e)}")
-            messagebox.showerror("Error", f"Failed to fetch data:\n{str(e)}")
+            self._on_fetch_error(e)
 
         finally:
             self.fetch_button.config(state=tk.NORMAL)
 
+    def _on_fetch_error(self, error):
+        """Report a failed fetch (runs on the main loop)"""
+        # Force a full re-render on the next fetch, even of identical data
+        self._table_hash = None
+        self._summary_hash = None
+
+        self._log_message(f"Error: {str(error)}")
+        self.status_label.config(text=f"✗ Error: {str(error)}")
+        # The scraper no longer holds exportable data matching the table
+        self.export_csv_button.config(state=tk.DISABLED)
+        self.export_json_button.config(state=tk.DISABLED)
+        messagebox.showerror("Error", f"Failed to fetch data:\n{str(error)}")
+        self.fetch_button.config(state=tk.NORMAL)
+
+    def _set_data(self, data_df):
+        """Store new data, re-sorting only when its content changed"""
+        import pandas as pd
+
+        self.data_df = data_df
+        data_hash = int(pd.util.hash_pandas_object(data_df, index=False).sum())
+        if data_hash != self._data_hash_value:
+            self._data_hash_value = data_hash
+            # Row positions ordered by max temperature, hottest first
+            self._sorted_idx = (-data_df['Max Temp (°C)'].to_numpy()).argsort(kind='stable')
+
     def _update_table(self):
         """Update treeview with data"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        if self.data_df is None:
+        if self._data_hash_value is not None and self._data_hash_value == self._table_hash:
             return
 
-        # Sort by max temperature
-        df = self.data_df.sort_values('Max Temp (°C)', ascending=False)
-
-        # Add items
-        for idx, row in df.iterrows():
-            values = (
-                row['City'],
-                f"{row['Min Temp (°C)']}°C",
-                f"{row['Max Temp (°C)']}°C",
-                row['Current Condition'],
-                f"{row['Humidity (%)']}%",
-                f"{row['Wind Speed (km/h)']} km/h"
-            )
-            self.tree.insert('', tk.END, values=values)
+        # Clear existing items; the scroll position is kept in _first_row
+        if self._shown_rows:
+            self.tree.delete(*self._shown_rows.values())
+            self._shown_rows = {}
+        self._all_rows = []
+        self._selected_row = None
+
+        if self.data_df is not None:
+            # Sort by max temperature using the precomputed permutation
+            df = self.data_df.iloc[self._sorted_idx]
+
+            # Format whole columns at once, then zip them into row tuples
+            self._all_rows = list(zip(
+                df['City'].tolist(),
+                df['Min Temp (°C)'].map('{:.1f}°C'.format).tolist(),
+                df['Max Temp (°C)'].map('{:.1f}°C'.format).tolist(),
+                df['Current Condition'].tolist(),
+                df['Humidity (%)'].map('{}%'.format).tolist(),
+                df['Wind Speed (km/h)'].map('{:.1f} km/h'.format).tolist()
+            ))
+
+        self._render_visible_rows()
+
+        # Only remember the hash once the table is fully rendered
+        self._table_hash = self._data_hash_value
 
     def _update_summary(self):
         """Update summary statistics"""
         if self.data_df is None:
             return
 
+        if self._data_hash_value == self._summary_hash:
+            return
+
         df = self.data_df
 
-        summary_text = f"""
+        # Compute all scalar statistics in a single aggregation pass
+        stats = df[['Min Temp (°C)', 'Max Temp (°C)']].agg(['mean', 'min', 'max', 'idxmin', 'idxmax'])
+        max_stats = stats['Max Temp (°C)']
+        min_stats = stats['Min Temp (°C)']
+        hottest_city = df.at[int(max_stats['idxmax']), 'City']
+        coldest_city = df.at[int(min_stats['idxmin']), 'City']
+
+        parts = [f"""
 {'='*60}
 TEMPERATURE SUMMARY STATISTICS
 {'='*60}
 
 Total Cities: {len(df)}
-Average Max Temperature: {df['Max Temp (°C)'].mean():.1f}°C
-Average Min Temperature: {df['Min Temp (°C)'].mean():.1f}°C
+Average Max Temperature: {max_stats['mean']:.1f}°C
+Average Min Temperature: {min_stats['mean']:.1f}°C
 
-Hottest City: {df.loc[df['Max Temp (°C)'].idxmax(), 'City']} ({df['Max Temp (°C)'].max()}°C)
-Coldest City: {df.loc[df['Min Temp (°C)'].idxmin(), 'City']} ({df['Min Temp (°C)'].min()}°C)
+Hottest City: {hottest_city} ({max_stats['max']}°C)
+Coldest City: {coldest_city} ({min_stats['min']}°C)
 
-Temperature Range: {df['Min Temp (°C)'].min()}°C to {df['Max Temp (°C)'].max()}°C
+Temperature Range: {min_stats['min']}°C to {max_stats['max']}°C
 
 {'='*60}
 TOP 5 HOTTEST CITIES:
 {'='*60}
-"""
+"""]
 
-        top_hot = df.nlargest(5, 'Max Temp (°C)')
-        for idx, (_, row) in enumerate(top_hot.iterrows(), 1):
-            summary_text += f"\n{idx}. {row['City']:<20} Max: {row['Max Temp (°C)']:>6.1f}°C | Min: {row['Min Temp (°C)']:>6.1f}°C"
+        # Reuse the cached max-temperature ordering rather than another partial sort
+        top_hot = df.iloc[self._sorted_idx[:5]][['City', 'Min Temp (°C)', 'Max Temp (°C)']]
+        for idx, (city, min_temp, max_temp) in enumerate(top_hot.itertuples(index=False, name=None), 1):
+            parts.append(f"\n{idx}. {city:<20} Max: {max_temp:>6.1f}°C | Min: {min_temp:>6.1f}°C")
 
-        summary_text += f"\n\n{'='*60}\nTOP 5 COLDEST CITIES:\n{'='*60}\n"
+        parts.append(f"\n\n{'='*60}\nTOP 5 COLDEST CITIES:\n{'='*60}\n")
 
-        top_cold = df.nsmallest(5, 'Min Temp (°C)')
-        for idx, (_, row) in enumerate(top_cold.iterrows(), 1):
-            summary_text += f"\n{idx}. {row['City']:<20} Min: {row['Min Temp (°C)']:>6.1f}°C | Max: {row['Max Temp (°C)']:>6.1f}°C"
+        top_cold = df.nsmallest(5, 'Min Temp (°C)')[['City', 'Min Temp (°C)', 'Max Temp (°C)']]
+        for idx, (city, min_temp, max_temp) in enumerate(top_cold.itertuples(index=False, name=None), 1):
+            parts.append(f"\n{idx}. {city:<20} Min: {min_temp:>6.1f}°C | Max: {max_temp:>6.1f}°C")
 
-        summary_text += f"\n\n{'='*60}\nAVERAGE HUMIDITY BY CONDITION:\n{'='*60}\n"
-        avg_humidity = df.groupby('Current Condition')['Humidity (%)'].mean().sort_values(ascending=False)
+        parts.append(f"\n\n{'='*60}\nAVERAGE HUMIDITY BY CONDITION:\n{'='*60}\n")
+        avg_humidity = (
+            df.groupby('Current Condition', observed=True, sort=False)['Humidity (%)']
+            .mean()
+            .sort_values(ascending=False)
+        )
         for condition, humidity in avg_humidity.items():
-            summary_text += f"\n{condition:<30} {humidity:>6.1f}%"
+            parts.append(f"\n{condition:<30} {humidity:>6.1f}%")
 
-        summary_text += f"\n\n{'='*60}"
+        parts.append(f"\n\n{'='*60}")
+        summary_text = "".join(parts)
 
         self.summary_text.config(state=tk.NORMAL)
         self.summary_text.delete('1.0', tk.END)
         self.summary_text.insert('1.0', summary_text)
         self.summary_text.config(state=tk.DISABLED)
 
+        # Only remember the hash once the summary is fully rendered
+        self._summary_hash = self._data_hash_value
+
     def _export_csv(self):
         """Export data to CSV"""
         if self.data_df is None:
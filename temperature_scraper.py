@@ -1,14 +1,72 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-import json
-from pathlib import Path
 import time
+import msgspec
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+MAX_WORKERS = 8
+CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+class CityTemp(msgspec.Struct):
+    """Temperature record for a single city, encoded with the export column names"""
+    city: str = msgspec.field(name='City')
+    min_temp: float = msgspec.field(name='Min Temp (°C)')
+    max_temp: float = msgspec.field(name='Max Temp (°C)')
+    condition: str = msgspec.field(name='Current Condition')
+    humidity: int = msgspec.field(name='Humidity (%)')
+    wind_speed: float = msgspec.field(name='Wind Speed (km/h)')
+    fetched_at: str = msgspec.field(name='Fetched At')
+
+
+# Subset of the wttr.in response schema; all other fields are skipped while decoding
+class _WeatherDesc(msgspec.Struct):
+    value: str
+
+
+class _CurrentCondition(msgspec.Struct):
+    weatherDesc: List[_WeatherDesc]
+    humidity: str
+    windspeedKmph: str
+
+
+class _DailyWeather(msgspec.Struct):
+    mintempC: str
+    maxtempC: str
+
+
+class _WttrResponse(msgspec.Struct):
+    current_condition: List[_CurrentCondition]
+    weather: List[_DailyWeather]
+
+
+_RESPONSE_DECODER = msgspec.json.Decoder(_WttrResponse)
+_CITY_DECODER = msgspec.json.Decoder(CityTemp)
+
+COLUMNS = tuple(field.encode_name for field in msgspec.structs.fields(CityTemp))
+
+# Explicit dtypes so pandas skips inference and stores compact columns
+COLUMN_DTYPES = {
+    'City': 'category',
+    'Min Temp (°C)': 'float32',
+    'Max Temp (°C)': 'float32',
+    'Current Condition': 'category',
+    'Humidity (%)': 'int16',
+    'Wind Speed (km/h)': 'float32',
+}
+
 
 class TemperatureScraper:
     """Scrapes temperature data for Indian cities"""
 
+    # Using wttr.in API which is free and doesn't require authentication.
+    # format=j2 is j1 without the hourly forecasts, which are never read.
+    WTTR_URL = "https://wttr.in/{city}?format=j2"
+
     def __init__(self):
         self.cities = [
             "New Delhi", "Kolkata", "Mumbai", "Chennai", "Bangalore",
@@ -20,66 +78,113 @@ class TemperatureScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        self.temperature_data = []
+        self.temperature_data: List[CityTemp] = []
+
+        # One pooled session so TCP/TLS handshakes are reused across cities
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retries)
+        self._session.mount('https://', adapter)
+
         self.output_dir = Path(__file__).parent / "output"
         self.output_dir.mkdir(exist_ok=True)
 
+        # Responses are cached per city per hour so repeated refreshes skip the network
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self._prune_cache()
+
+    def _prune_cache(self):
+        """Remove cached responses older than a day"""
+        cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                if cache_file.stat().st_mtime < cutoff:
+                    cache_file.unlink()
+            except OSError:
+                pass
+
+    def to_dataframe(self):
+        """Build a typed DataFrame from the scraped records"""
+        # Imported lazily to keep pandas off the startup path
+        import pandas as pd
+
+        # Transpose the records into columns so pandas skips per-row inference
+        rows = [msgspec.structs.astuple(record) for record in self.temperature_data]
+        columns = zip(*rows) if rows else ([] for _ in COLUMNS)
+        return pd.DataFrame(dict(zip(COLUMNS, map(list, columns)))).astype(COLUMN_DTYPES)
+
     def scrape_weather_data(self):
         """Scrape weather data for all cities"""
         print("Starting temperature scraping for Indian cities...")
         print("-" * 60)
 
-        for city in self.cities:
-            print(f"Fetching data for {city}...", end=" ")
-            try:
-                temp_data = self._fetch_city_temperature(city)
-                if temp_data:
-                    self.temperature_data.append(temp_data)
-                    print(f"✓ Min: {temp_data['Min Temp (°C)']}°C, Max: {temp_data['Max Temp (°C)']}°C")
-                else:
-                    print("✗ Failed to fetch")
-            except Exception as e:
-                print(f"✗ Error: {str(e)}")
-
-            # Be respectful to the server
-            time.sleep(1)
+        # Requests are I/O-bound, so overlap them instead of fetching serially
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(self._fetch_city_temperature_safe, self.cities))
 
+        # Collect into a local list so readers never see a partially built result
+        temperature_data = []
+        for city, temp_data in zip(self.cities, results):
+            if temp_data:
+                temperature_data.append(temp_data)
+                print(f"{city}: ✓ Min: {temp_data.min_temp}°C, Max: {temp_data.max_temp}°C")
+            else:
+                print(f"{city}: ✗ Failed to fetch")
+
+        self.temperature_data = temperature_data
         print("-" * 60)
         return self.temperature_data
 
+    def _fetch_city_temperature_safe(self, city):
+        """Fetch a single city, reporting unexpected errors instead of raising"""
+        try:
+            return self._fetch_city_temperature(city)
+        except Exception as e:
+            print(f"Error fetching data for {city}: {str(e)}")
+            return None
+
     def _fetch_city_temperature(self, city):
         """Fetch temperature for a single city using wttr.in API"""
+        cache_file = self.cache_dir / f"{city}_{datetime.now():%Y%m%d%H}.json"
+        if cache_file.exists():
+            try:
+                return _CITY_DECODER.decode(cache_file.read_bytes())
+            except (OSError, msgspec.DecodeError):
+                pass
+
         try:
-            # Using wttr.in API which is free and doesn't require authentication
-            url = f"https://wttr.in/{city}?format=j1"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._session.get(self.WTTR_URL.format(city=city), timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            # Decode straight into typed structs, skipping the unused fields
+            data = _RESPONSE_DECODER.decode(response.content)
 
             # Extract current day's temperature data
-            current_condition = data['current_condition'][0]
-
-            min_temp = data['weather'][0]['mintempC']
-            max_temp = data['weather'][0]['maxtempC']
-            condition = current_condition['weatherDesc'][0]['value']
-            humidity = current_condition['humidity']
-            wind_speed = current_condition['windspeedKmph']
-
-            return {
-                'City': city,
-                'Min Temp (°C)': float(min_temp),
-                'Max Temp (°C)': float(max_temp),
-                'Current Condition': condition,
-                'Humidity (%)': int(humidity),
-                'Wind Speed (km/h)': float(wind_speed),
-                'Fetched At': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            current_condition = data.current_condition[0]
+            today = data.weather[0]
+
+            result = CityTemp(
+                city=city,
+                min_temp=float(today.mintempC),
+                max_temp=float(today.maxtempC),
+                condition=current_condition.weatherDesc[0].value,
+                humidity=int(current_condition.humidity),
+                wind_speed=float(current_condition.windspeedKmph),
+                fetched_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
+
+            try:
+                cache_file.write_bytes(msgspec.json.encode(result))
+            except OSError as e:
+                print(f"Could not cache data for {city}: {e}")
+            return result
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data for {city}: {e}")
             return None
-        except (KeyError, json.JSONDecodeError) as e:
+        except (IndexError, ValueError, msgspec.DecodeError) as e:
             print(f"Error parsing data for {city}: {e}")
             return None
 
@@ -89,7 +194,7 @@ class TemperatureScraper:
             print("No data to save.")
             return None
 
-        df = pd.DataFrame(self.temperature_data)
+        df = self.to_dataframe()
 
         # Sort by max temperature (descending)
         df = df.sort_values('Max Temp (°C)', ascending=False)
@@ -111,8 +216,8 @@ class TemperatureScraper:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         json_file = self.output_dir / f"temperature_data_{timestamp}.json"
 
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(self.temperature_data, f, indent=2, ensure_ascii=False)
+        # msgspec always emits UTF-8, so non-ASCII text is written as-is
+        json_file.write_bytes(msgspec.json.format(msgspec.json.encode(self.temperature_data), indent=2))
 
         print(f"✓ Data saved to JSON: {json_file}")
         return json_file
@@ -123,7 +228,7 @@ class TemperatureScraper:
             print("No data available.")
             return
 
-        df = pd.DataFrame(self.temperature_data)
+        df = self.to_dataframe()
 
         print("\n" + "=" * 60)
         print("TEMPERATURE SUMMARY")